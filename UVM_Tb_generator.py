@@ -42,103 +42,316 @@
 #   You are free to modify, distribute, and use it as part of your projects.
 # =============================================================================
 
+import collections
+import concurrent.futures
 import csv
+import functools
+import io
+import logging
+import logging.handlers
 import os
+import re
+import string
 import sys
 import textwrap
 
-# Open a log file to capture all print output
-log_file_name = "Py_log.txt"
-log_file = open( log_file_name, "w")
-sys.stdout = log_file
-sys.stderr = log_file  # Optional: Also capture errors
-
-import platform
-from datetime import datetime
+try:
+    import pandas as pd  # optional: faster parsing of large CSVs
+except ImportError:
+    pd = None
 
 # === Setup logging ===
-class Logger(object):
-    def __init__(self, file):
-        self.terminal = sys.__stdout__
-        self.log = open(file, "w")
+# Progress messages go through the "uvm_tb" logger. Handlers are only
+# attached by setup_logging(), so importing this module writes nothing.
+log_file_name = "Py_log.txt"
+logger = logging.getLogger("uvm_tb")
+logger.setLevel(logging.INFO)
+logger.propagate = False
 
-    def write(self, message):
-        self.terminal.write(message)
-        self.log.write(message)
+# Rule printed between the sections of the log
+LOG_SEPARATOR = "-" * 76
 
-    def flush(self):
-        self.terminal.flush()
-        self.log.flush()
+def log_readme_note(subject, lead=""):
+    """Logs a generator's closing pointer to README.txt as one record."""
+    logger.info(f"{lead}Refer to README.txt for a detailed summary of {subject} file:\n"
+                f"   → {README_PATH}\n"
+                f"{LOG_SEPARATOR}")
 
-sys.stdout = Logger(log_file_name)
-sys.stderr = sys.stdout
+def setup_logging():
+    """
+    Sends log records to Py_log.txt and the terminal in batches of up to
+    1024; anything still buffered goes out when logging shuts down at exit.
+    """
+    for target in (logging.FileHandler(log_file_name, mode="w"),
+                   logging.StreamHandler(sys.__stdout__)):
+        target.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(logging.handlers.MemoryHandler(capacity=1024, target=target))
 
-# === Log Header ===
-print(f">> Log started at: {datetime.now()} <<")
-print(f">> Python version: {platform.python_version()} ({sys.executable}) <<\n")
+    # Uncaught errors end up in the log too (ERROR flushes the buffers at once)
+    sys.excepthook = lambda *exc_info: logger.critical("Unhandled exception:", exc_info=exc_info)
 
 CSV_FILE = "UVM_TB_PARAMS.csv"
 OUTPUT_DIR = "verif"
 
+# Output tree, resolved once against the directory the script runs in
+BASE_DIR = os.getcwd()
+VERIF_DIR = os.path.join(BASE_DIR, OUTPUT_DIR)
+TOP_DIR = os.path.join(VERIF_DIR, "TOP")
+TEST_DIR = os.path.join(VERIF_DIR, "TEST_LIB")
+SEQ_DIR = os.path.join(VERIF_DIR, "SEQ_LIB")
+ENV_DIR = os.path.join(VERIF_DIR, "ENV")
+AGENTS_DIR = os.path.join(ENV_DIR, "AGENTS")
+SBD_DIR = os.path.join(ENV_DIR, "SBD")
+RAL_DIR = os.path.join(VERIF_DIR, "RAL")
+SIM_DIR = os.path.join(VERIF_DIR, "SIM")
+README_PATH = os.path.join(SIM_DIR, "README.txt")
+
+# CSVs longer than this many rows are parsed with pandas when available
+PANDAS_ROW_THRESHOLD = 64
+
+# === Template rendering ===
+# Templates are plain str.format strings; str.format expands every
+# placeholder in a single pass. Identical renderings (same template,
+# same values) are memoized so repeated generations reuse the result;
+# the cache is bounded, since a sweep over many configs would otherwise
+# keep every file body it ever rendered.
+RENDER_CACHE_SIZE = 32
+
+@functools.lru_cache(maxsize=RENDER_CACHE_SIZE)
+def render_template(template, **ctx):
+    return template.format(**ctx)
+
+# Partial rendering: fills the given fields and leaves every other
+# {field} in place, so DUT-wide values can be substituted once and only
+# the per-interface fields remain for the inner loop.
+class _KeepMissing(dict):
+    def __missing__(self, key):
+        return "{" + key + "}"
+
+@functools.lru_cache(maxsize=None)
+def specialize_template(template, **ctx):
+    return template.format_map(_KeepMissing(ctx))
+
+# === Output directories ===
+# Every directory is created at most once per run; created_dirs remembers
+# what already exists so repeat requests cost no filesystem call.
+created_dirs = set()
+
+def ensure_dir(path):
+    if path not in created_dirs:
+        os.makedirs(path, exist_ok=True)
+        created_dirs.add(path)
+
+# === File emission ===
+# Generators collect {path: content} and hand the whole batch over here:
+# each file is written with a single os.write() of its pre-assembled bytes.
+# Larger batches are spread over a thread pool, since the writes release
+# the GIL while they wait on the filesystem.
+PARALLEL_WRITE_MIN = 8
+WRITE_WORKERS = min(8, os.cpu_count() or 1)
+
+def write_file(item):
+    path, content = item
+    data = memoryview(content.encode("utf-8"))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        # os.write() may stop short; keep going until every byte is out
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+def write_files(files):
+    for d in {os.path.dirname(path) for path in files}:
+        ensure_dir(d)
+
+    if len(files) < PARALLEL_WRITE_MIN or WRITE_WORKERS < 2:
+        for item in files.items():
+            write_file(item)
+        return
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=WRITE_WORKERS) as pool:
+        # Draining the iterator re-raises the first failed write here
+        for _ in pool.map(write_file, files.items()):
+            pass
+
+def submit_files(pool, files):
+    """
+    Queues the writes of files ({path: content}) on an existing pool and
+    returns their futures, for callers that stream several small batches.
+    """
+    for d in {os.path.dirname(path) for path in files}:
+        ensure_dir(d)
+    return [pool.submit(write_file, item) for item in files.items()]
+
+# === Per-interface derived names ===
+# Every generator needs the same handful of class/instance names for an
+# interface; they are derived once per interface name and shared.
+NameSet = collections.namedtuple(
+    "NameSet", "raw lc upper if_type pif agent")
+
+@functools.lru_cache(maxsize=None)
+def interface_names(name):
+    lc = name.strip().lower()
+    return NameSet(
+        raw=name,
+        lc=lc,
+        upper=name.upper(),
+        if_type=f"{lc}_if",
+        pif=f"{lc}_pif",
+        agent=f"{lc}_agent",
+    )
+
+def read_csv_rows(filename):
+    """
+    Returns the rows of the CSV as sequences of raw cell strings.
+    Large files go through pandas' C tokenizer if pandas is installed.
+    The config format is flat, so otherwise each line is simply split on
+    commas; the stdlib csv module is only needed when a cell is quoted.
+    """
+    with open(filename, newline='', buffering=1 << 17) as csvfile:
+        text = csvfile.read()
+
+    if pd is not None and text.count("\n") > PANDAS_ROW_THRESHOLD:
+        # pandas rejects rows wider than the column list, so it is sized
+        # from the widest line; shorter rows are padded with empty cells
+        width = max(line.count(",") for line in text.splitlines()) + 1
+        df = pd.read_csv(io.StringIO(text), header=None, names=range(width),
+                         dtype=str, skipinitialspace=True, na_filter=False)
+        return df.itertuples(index=False, name=None)
+
+    if '"' in text:
+        return csv.reader(io.StringIO(text))
+
+    return (line.split(",") for line in text.splitlines())
+
+# INTF row fields after the key: <Name>,<Mode>,<Freq>,<ClkName>,[<RstName>,<RstType>]
+# The reset part is optional, its brackets and its type are optional too.
+# Any cells after the reset type are ignored.
+INTF_RE = re.compile(r"""
+    (?P<name>[^,]+) , (?P<mode>[^,]+) , (?P<speed>[^,]+) , (?P<clk>[^,]+)
+    (?: , \[?\s* (?P<rst>[^,\[\]]+?) \s*
+        (?: , \s* (?P<rst_type>[^,\[\]]+?) \s* )? \]? )?
+    (?: , .* )?
+    $""", re.VERBOSE)
+
+# Reset polarity as written in the CSV -> "1" (active high) / "0" (active low)
+RST_TYPES = {"active_high": "1", "1": "1", "active_low": "0", "0": "0"}
+
+# Clock period derivation. Interfaces commonly share a frequency, so the
+# result is memoized per speed string.
+@functools.lru_cache(maxsize=None)
+def clock_timing(speed):
+    """
+    Returns (speed_mhz, period_ns, half_period_ns) for a speed in MHz,
+    or None if the speed is missing, "nil", not an integer or not positive.
+    """
+    if not speed or speed.lower() == "nil":
+        return None
+    try:
+        speed_mhz = int(speed)
+    except ValueError:
+        return None
+    if speed_mhz <= 0:
+        return None
+
+    period_ns = round(1000 / speed_mhz, 3)
+    return speed_mhz, period_ns, round(period_ns / 2, 3)
+
+# One parsed INTF row. rst/rst_type are None when no reset is given;
+# names holds the derived class/instance names (see interface_names).
+# The remaining fields are worked out once at parse time for top.sv:
+# has_clk/has_rst tell whether the signal is set (and not "nil"), timing
+# is clock_timing(speed) for a clocked interface, and assert_val /
+# deassert_val are the reset pulse levels (None when there is no pulse).
+Intf = collections.namedtuple(
+    "Intf", "name mode speed clk rst rst_type names "
+            "has_clk has_rst timing assert_val deassert_val")
+
+# === Row handlers, dispatched on the normalized first cell ===
+def handle_dut_name(row, config, interfaces):
+    if len(row) >= 2:
+        config["dut_name"] = row[1]
+
+def handle_num_intf(row, config, interfaces):
+    if len(row) >= 2:
+        config["num_interfaces"] = int(row[1])
+
+def handle_intf(row, config, interfaces):
+    # The bracketed reset spans two CSV cells, so match on the
+    # re-joined fields rather than on individual cells
+    m = INTF_RE.match(",".join(row[1:]))
+    if not m:
+        logger.info(f"Skipping malformed INTF row: {','.join(row)}")
+        return
+
+    fields = m.groupdict()
+
+    # === Optional reset info ===
+    if fields["rst"]:
+        rst_type = fields["rst_type"] or "1"  # default to active-high
+        fields["rst_type"] = RST_TYPES.get(rst_type.lower(), rst_type)
+    else:
+        fields["rst_type"] = None
+
+    clk, rst, rst_type = fields["clk"], fields["rst"], fields["rst_type"]
+    has_clk = bool(clk) and clk.lower() != "nil"
+    has_rst = bool(rst) and rst.lower() != "nil"
+    if has_clk and has_rst and rst_type:
+        assert_val, deassert_val = ("1", "0") if rst_type == "1" else ("0", "1")
+    else:
+        assert_val = deassert_val = None
+
+    interfaces.append(Intf(names=interface_names(fields["name"]),
+                           has_clk=has_clk, has_rst=has_rst,
+                           timing=clock_timing(fields["speed"]) if has_clk else None,
+                           assert_val=assert_val, deassert_val=deassert_val,
+                           **fields))
+
+def ignore_row(row, config, interfaces):
+    pass
+
+ROW_HANDLERS = {
+    "DUT_NAME": handle_dut_name,
+    "NUM_INTF": handle_num_intf,
+    "INTF": handle_intf,
+}
+
+# Row keys are matched case-insensitively with spaces read as underscores
+# ("Dut name" -> "DUT_NAME"); one translate() pass does both.
+KEY_TABLE = str.maketrans(string.ascii_lowercase + " ", string.ascii_uppercase + "_")
+
 def read_interface_csv(filename):
     config = {}
     interfaces = []
 
-    with open(filename, newline='') as csvfile:
-        reader = csv.reader(csvfile)
-        for row in reader:
-            # Clean up row values
-            row = [cell.strip() for cell in row if cell.strip()]
-            if not row:
-                continue
-
-            key = row[0].upper().replace(" ", "_")
-
-            if key == "DUT_NAME" and len(row) >= 2:
-                config["dut_name"] = row[1]
-
-            elif key == "NUM_INTF" and len(row) >= 2:
-                config["num_interfaces"] = int(row[1])
-
-            elif key == "INTF" and len(row) >= 5:
-                interface = {
-                    "name": row[1],
-                    "mode": row[2],
-                    "speed": row[3],
-                    "clk": row[4]
-                }
-
-                # === Optional reset info ===
-                if len(row) >= 6 and ',' in row[5]:
-                    rst_fields = row[5].split(',')
-                    interface["rst"] = rst_fields[0].strip()
-                    interface["rst_type"] = rst_fields[1].strip() if len(rst_fields) > 1 else "1"  # default to active-high
-                elif len(row) >= 6:
-                    interface["rst"] = row[5].strip()
-                    interface["rst_type"] = "1"  # default active-high
-                else:
-                    interface["rst"] = None
-                    interface["rst_type"] = None
-
-                interfaces.append(interface)
+    for row in read_csv_rows(filename):
+        # Clean up row values (strip each cell once, drop empties)
+        row = [cell for cell in map(str.strip, row) if cell]
+        if row:
+            # Keys already written in canonical form skip the translation
+            handler = (ROW_HANDLERS.get(row[0])
+                       or ROW_HANDLERS.get(row[0].translate(KEY_TABLE), ignore_row))
+            handler(row, config, interfaces)
 
     config["interfaces"] = interfaces
     return config
 
-
-config = read_interface_csv(CSV_FILE)
-
-print("----------------------------------------------------------------------------")
-# === Print DUT info ===
-print(f"DUT Name        : {config.get('dut_name')}")
-print(f"Num Interfaces  : {config.get('num_interfaces')}")
-
-# === Print each interface ===
-print("\nParsed Interface Configurations:")
-for i, intf in enumerate(config.get("interfaces", []), start=1):
-    print(f"[{i}] Name: {intf.get('name')}, Mode: {intf.get('mode')}, Speed: {intf.get('speed')}, "
-          f"Clk: {intf.get('clk')}, Rst: {intf.get('rst')}, Rst Type: {intf.get('rst_type')}")
-print("----------------------------------------------------------------------------")
+def log_config(config):
+    # Built up first and logged as a single record
+    lines = [
+        LOG_SEPARATOR,
+        # === Print DUT info ===
+        f"DUT Name        : {config.get('dut_name')}",
+        f"Num Interfaces  : {config.get('num_interfaces')}",
+        # === Print each interface ===
+        "\nParsed Interface Configurations:",
+    ]
+    lines.extend(f"[{i}] Name: {intf.name}, Mode: {intf.mode}, Speed: {intf.speed}, "
+                 f"Clk: {intf.clk}, Rst: {intf.rst}, Rst Type: {intf.rst_type}"
+                 for i, intf in enumerate(config.get("interfaces", []), start=1))
+    lines.append(LOG_SEPARATOR)
+    logger.info("\n".join(lines))
 
 #  creating directory structure as 
 #  <your current PWD>/verif/
@@ -151,31 +364,13 @@ print("-------------------------------------------------------------------------
 #  ├── RAL/
 
 def create_uvm_tb_dirs():
-    # Get current working directory
-    base_dir = os.getcwd()
-
-    # Base verification directory
-    verif_dir = os.path.join(base_dir, "verif")
-
     # Define all required subdirectories
-    dirs_to_create = [
-        os.path.join(verif_dir, "TOP"),
-        os.path.join(verif_dir, "TEST_LIB"),
-        os.path.join(verif_dir, "SEQ_LIB"),
-        os.path.join(verif_dir, "ENV"),
-        os.path.join(verif_dir, "ENV", "AGENTS"),
-        os.path.join(verif_dir, "ENV", "SBD"),
-        os.path.join(verif_dir, "RAL"),
-        os.path.join(verif_dir, "SIM")
-    ]
+    dirs_to_create = [TOP_DIR, TEST_DIR, SEQ_DIR, ENV_DIR, AGENTS_DIR, SBD_DIR, RAL_DIR, SIM_DIR]
 
     # Create directories
     for d in dirs_to_create:
-        os.makedirs(d, exist_ok=True)
-        print(f"Created: {d}")
-
-create_uvm_tb_dirs()
-print("----------------------------------------------------------------------------")
+        ensure_dir(d)
+        logger.info(f"Created: {d}")
 
 # generate rst logic based on rst_type
 # Active-High Reset (rst_type == "1"):
@@ -183,109 +378,76 @@ print("-------------------------------------------------------------------------
 # Active-Low Reset (rst_type == "0"):
 # rst = 0; @(posedge clk); rst = 1;
 
-def generate_top_sv_from_cfg(config):
-    top_sv_path = os.path.join(os.getcwd(), "verif", "TOP", "top.sv")
-    lines = []
-
-    lines.append("module top;\n")
+# Per-interface line formats, bound once; each takes a NameSet
+TOP_PIF_INST_FMT = "  {0.if_type} {0.pif}();  // TODO: Create {0.raw} interface files\n".format
+TOP_VIF_SET_FMT = "    uvm_config_db#(virtual {0.if_type})::set(null, \"*\", \"vif\", {0.pif});\n".format
 
-    # === Signal Declarations ===
-    for intf in config.get("interfaces", []):
-        clk = intf.get("clk")
-        rst = intf.get("rst")
+def generate_top_sv_from_cfg(config, readme):
+    top_sv_path = os.path.join(TOP_DIR, "top.sv")
 
-        if clk and clk.lower() != "nil":
-            lines.append(f"  logic {clk};")
-        if rst and rst.lower() != "nil":
-            lines.append(f"  logic {rst};")
-    lines.append("")
+    # Single pass over the interfaces, filling one buffer per section
+    decls, clkgen, rstgen = io.StringIO(), io.StringIO(), io.StringIO()
+    pif_names = []  # interfaces that get a pif instance (and a config_db entry)
 
-    # === Clock Generators ===
-    for intf in config.get("interfaces", []):
-        clk = intf.get("clk")
-        speed = intf.get("speed")
-
-        if not clk or clk.lower() == "nil" or not speed or speed.lower() == "nil":
-            continue
-
-        try:
-            speed = int(speed)
-            if speed <= 0:
-                continue
-            period_ns = round(1000 / speed, 3)
-            half_period = round(period_ns / 2, 3)
-
-            lines.append(f"  // {clk} clock generation at {speed} MHz (~{period_ns}ns)")
-            lines.append(f"  initial {clk} = 0;")
-            lines.append(f"  always #{half_period} {clk} = ~{clk};\n")
-        except (ValueError, ZeroDivisionError):
-            continue
-
-    # === Reset Pulses Using @(posedge clk) ===
     for intf in config.get("interfaces", []):
-        clk = intf.get("clk")
-        rst = intf.get("rst")
-        rst_type = intf.get("rst_type")
-
-        if not clk or clk.lower() == "nil":
-            continue
-        if not rst or rst.lower() == "nil":
-            continue
-        if not rst_type:
-            continue
-
-        active_high = rst_type == "1"
-        assert_val = "1" if active_high else "0"
-        deassert_val = "0" if active_high else "1"
-
-        lines.append(f"  // {rst} reset pulse using @{clk}, active {'high' if active_high else 'low'}")
-        lines.append("  initial begin")
-        lines.append(f"    {rst} = {assert_val};")
-        lines.append(f"    @(posedge {clk});")
-        lines.append(f"    {rst} = {deassert_val};")
-        lines.append("  end\n")
+        name, clk, rst = intf.name, intf.clk, intf.rst
+
+        # === Signal Declarations ===
+        if intf.has_clk:
+            decls.write(f"  logic {clk};\n")
+        if intf.has_rst:
+            decls.write(f"  logic {rst};\n")
+
+        # === Clock Generators ===
+        if intf.timing is not None:
+            speed, period_ns, half_period = intf.timing
+            clkgen.write(f"  // {clk} clock generation at {speed} MHz (~{period_ns}ns)\n"
+                         f"  initial {clk} = 0;\n"
+                         f"  always #{half_period} {clk} = ~{clk};\n\n")
+
+        # === Reset Pulses Using @(posedge clk) ===
+        if intf.assert_val is not None:
+            level = "high" if intf.assert_val == "1" else "low"
+            rstgen.write(f"  // {rst} reset pulse using @{clk}, active {level}\n"
+                         f"  initial begin\n"
+                         f"    {rst} = {intf.assert_val};\n"
+                         f"    @(posedge {clk});\n"
+                         f"    {rst} = {intf.deassert_val};\n"
+                         f"  end\n\n")
 
-    # === Interface Instantiations ===
-    lines.append("  // Interface Instantiations")
-    for intf in config.get("interfaces", []):
-        name = intf.get("name")
         if name and name.lower() != "nil":
-            inst_name = name.lower() + "_pif"
-            lines.append(f"  {name.lower()}_if {inst_name}();  // TODO: Create {name} interface files")
-    lines.append("")
+            pif_names.append(intf.names)
 
-	 # === DUT Instantiation ===
-    dut_name = config.get("dut_name", "dut")
-    lines.append(f"  // DUT instantiation")
-    lines.append(f"  {dut_name} u_{dut_name.lower()} (")
-    lines.append("    // TODO: Connect ports using pif handles ")
-    lines.append("  );\n")
+    # Sections are kept as newline-terminated chunks and joined once
+    parts = ["module top;\n\n", decls.getvalue(), "\n", clkgen.getvalue(), rstgen.getvalue()]
 
-    # === UVM Run Test with lowercase DUT-based name ===
+    # === Interface Instantiations ===
+    parts.append("  // Interface Instantiations\n")
+    parts.extend(map(TOP_PIF_INST_FMT, pif_names))
+    parts.append("\n")
+
+    # === DUT Instantiation / UVM run_test() with lowercase DUT-based name ===
     dut_name = config.get("dut_name", "dut")
     test_name = f"{dut_name.lower()}_base_test"
-    lines.append("  // UVM run_test() call")
-    lines.append("  initial begin")
-    lines.append(f"    run_test(\"{test_name}\");")
-    lines.append("  end\n")
+    parts.append(f"  // DUT instantiation\n"
+                 f"  {dut_name} u_{dut_name.lower()} (\n"
+                 f"    // TODO: Connect ports using pif handles \n"
+                 f"  );\n\n"
+                 f"  // UVM run_test() call\n"
+                 f"  initial begin\n"
+                 f"    run_test(\"{test_name}\");\n"
+                 f"  end\n\n")
 
     # === Pass Interfaces to UVM via uvm_config_db ===
-    lines.append("  // Passing interfaces to UVM via uvm_config_db")
-    lines.append("  initial begin")
-    for intf in config.get("interfaces", []):
-        name = intf.get("name")
-        if name and name.lower() != "nil":
-            iface_type = f"{name.lower()}_if"
-            inst_name = f"{name.lower()}_pif"
-            lines.append(f"    uvm_config_db#(virtual {iface_type})::set(null, \"*\", \"vif\", {inst_name});")
-    lines.append("  end\n")
-
+    parts.append("  // Passing interfaces to UVM via uvm_config_db\n"
+                 "  initial begin\n")
+    parts.extend(map(TOP_VIF_SET_FMT, pif_names))
+    parts.append("  end\n\n")
 
-    lines.append("endmodule")
+    parts.append("endmodule")
 
-    with open(top_sv_path, "w") as f:
-        f.write("\n".join(lines))
-        print(f"Generated: {top_sv_path}\n")
+    write_files({top_sv_path: "".join(parts)})
+    logger.info(f"Generated: {top_sv_path}\n")
 
     # === Prepare README Summary ===
     readme_lines = []
@@ -298,30 +460,27 @@ def generate_top_sv_from_cfg(config):
     readme_lines.append("top.sv contents:")
     readme_lines.append(f"- `module top;` with DUT `{dut_name}` instantiated")
 
-    if any(intf.get("clk") for intf in intfs):
+    if any(intf.clk for intf in intfs):
         readme_lines.append("- Clock signal declarations and generation:")
         for intf in intfs:
-            clk = intf.get("clk")
-            speed = intf.get("speed")
-            if clk and clk.lower() != "nil":
-                speed_str = f"{speed} MHz" if speed else "default"
-                readme_lines.append(f"    • {clk}  ({speed_str})")
+            if intf.has_clk:
+                speed_str = f"{intf.speed} MHz" if intf.speed else "default"
+                readme_lines.append(f"    • {intf.clk}  ({speed_str})")
 
-    if any(intf.get("rst") for intf in intfs):
+    if any(intf.rst for intf in intfs):
         readme_lines.append("- Reset pulse logic based on @posedge clk:")
         for intf in intfs:
-            rst = intf.get("rst")
-            clk = intf.get("clk")
-            rst_type = intf.get("rst_type")
+            rst = intf.rst
+            clk = intf.clk
+            rst_type = intf.rst_type
             if rst and clk:
                 type_str = "active high" if rst_type == "1" else "active low" if rst_type == "0" else "unspecified"
                 readme_lines.append(f"    • {rst}  ({type_str}) driven by {clk}")
 
     readme_lines.append("- Interface instantiations:")
     for intf in intfs:
-        name = intf.get("name")
-        if name:
-            readme_lines.append(f"    • {name.lower()}_if {name.lower()}_if_inst();")
+        if intf.name:
+            readme_lines.append(f"    • {intf.names.if_type} {intf.names.if_type}_inst();")
 
     readme_lines.append("- uvm_config_db set() calls to pass virtual interfaces")
     readme_lines.append(f"- run_test(\"{dut_name.lower()}_base_test\")` to launch simulation\n")
@@ -329,34 +488,77 @@ def generate_top_sv_from_cfg(config):
     readme_lines.append("TODOs for User To code in top.sv:")
     readme_lines.append("- Connect interface instances to DUT ports:")
     for intf in intfs:
-        name = intf.get("name")
-        if name:
-            readme_lines.append(f"    • Connect `{name.lower()}_if_inst` to DUT")
+        if intf.name:
+            readme_lines.append(f"    • Connect `{intf.names.if_type}_inst` to DUT")
     readme_lines.append("- Define SystemVerilog interface files (*.sv)")
     readme_lines.append("\n-----------------------------------------------------------")
 
-    sim_dir = os.path.join(os.getcwd(), "verif", "SIM")
-    os.makedirs(sim_dir, exist_ok=True)
-    
-    readme_path = os.path.join(sim_dir, "README.txt")
-	 
-    with open(readme_path, "w") as readme_file:
-        readme_file.write("\n".join(readme_lines))
-        print("Refer to README.txt for a detailed summary of top.sv file:")
-        print(f"   → {readme_path}")
+    readme.write("\n".join(readme_lines))
+    log_readme_note("top.sv")
+
+# Pre-dedented once at import; only the class names vary per DUT.
+TEST_TEMPLATE = textwrap.dedent("""\
+    // ----------------------------------------------------
+    // UVM Test: {test_class}
+    // ----------------------------------------------------
+    class {test_class} extends uvm_test;
+      `uvm_component_utils({test_class})
+
+      // Environment handle
+      {env_class} {env_class}_h;
+
+      function new(string name = "{test_class}", uvm_component parent = null);
+        super.new(name, parent);
+      endfunction
 
-    print("----------------------------------------------------------------------------")
+      virtual function void build_phase(uvm_phase phase);
+        super.build_phase(phase);
+        {env_class}_h = {env_class}::type_id::create("{env_class}_h", this);
+      endfunction
 
-generate_top_sv_from_cfg(config)
+      virtual task run_phase(uvm_phase phase);
+        {seq_class} seq = {seq_class}::type_id::create("seq");
+        `uvm_info(get_full_name(),"Run_phase started", UVM_NONE)
 
-def generate_uvm_test(config):
+        phase.raise_objection(this);
+
+        // TODO: Update sequencer path if not {env_class}_h.sqr
+        seq.start({env_class}_h.sqr);
+
+        phase.phase_done.set_drain_time(this,1000);
+        phase.drop_objection(this);
+
+        `uvm_info(get_full_name(),"Run_phase End", UVM_NONE)
+
+      endtask
+
+    endclass : {test_class}
+    """)
+
+TEST_SUMMARY_TEMPLATE = textwrap.dedent("""\
+        
+
+        {test_class}.sv Summary
+
+        Class Structure:
+        - class {test_class} extends uvm_test
+        - Factory registered using `uvm_component_utils({test_class})`
+        - build_phase(): creates `{env_class}`
+        - run_phase():
+            - Creates `{seq_class}`
+            - Raises/drops uvm_objection
+            - Calls `start()` on `{env_class}_h.sqr`
+        ------------------------------------------------------------------------
+        """)
+
+def generate_uvm_test(config, readme):
     """
     Generate a UVM base test class file named <dut_name>_base_test.sv
     under the directory verif/TEST_LIB/.
     """
     dut_name = config.get("dut_name", "").strip().lower()
     if not dut_name:
-        print("No DUT name found in configuration. Skipping UVM test generation.")
+        logger.info("No DUT name found in configuration. Skipping UVM test generation.")
         return
 
     # Construct names
@@ -364,87 +566,51 @@ def generate_uvm_test(config):
     env_class = f"{dut_name}_env"
     seq_class = f"{dut_name}_base_seq"
 
-    # Create TEST_LIB directory if needed
-    test_dir = os.path.join(os.getcwd(), "verif", "TEST_LIB")
-    sim_dir = os.path.join(os.getcwd(), "verif", "SIM")
-    os.makedirs(test_dir, exist_ok=True)
-    os.makedirs(sim_dir, exist_ok=True)
-    test_file_path = os.path.join(test_dir, f"{test_class}.sv")
-    readme_path = os.path.join(sim_dir, "README.txt")
-	 
+    # Output paths (directories are created through ensure_dir)
+    test_file_path = os.path.join(TEST_DIR, f"{test_class}.sv")
 
     # === Generate file content without leading spaces ===
-    content = textwrap.dedent(f"""\
-	 // ----------------------------------------------------
-	 // UVM Test: {test_class}
-	 // ----------------------------------------------------
-	 class {test_class} extends uvm_test;
-	   `uvm_component_utils({test_class})
-	 
-	   // Environment handle
-	   {env_class} {env_class}_h;
-	 
-	   function new(string name = "{test_class}", uvm_component parent = null);
-	     super.new(name, parent);
-	   endfunction
-	 
-	   virtual function void build_phase(uvm_phase phase);
-	     super.build_phase(phase);
-	  	{env_class}_h = {env_class}::type_id::create("{env_class}_h", this);
-	   endfunction
-	 
-	   virtual task run_phase(uvm_phase phase);
-	     {seq_class} seq = {seq_class}::type_id::create("seq");
-		  `uvm_info(get_full_name(),"Run_phase started", UVM_NONE)
-	 
-	     phase.raise_objection(this);
-	 
-	     // TODO: Update sequencer path if not {env_class}_h.sqr
-	     seq.start({env_class}_h.sqr);
-	 
-	  	phase.phase_done.set_drain_time(this,1000);
-	  	phase.drop_objection(this);
-
-	  	`uvm_info(get_full_name(),"Run_phase End", UVM_NONE)
-	 
-	   endtask
-	 
-	 endclass : {test_class}
-    """)
+    content = render_template(TEST_TEMPLATE, test_class=test_class, env_class=env_class, seq_class=seq_class)
 
     # Write file
-    with open(test_file_path, "w") as f:
-        f.write(content)
+    write_files({test_file_path: content})
 
-    print(f"Generated: {test_file_path}")
+    logger.info(f"Generated: {test_file_path}")
 
-	# Append summary to README.txt
-    summary = textwrap.dedent(f"""\
-        
+    # Append summary to README.txt
+    summary = render_template(TEST_SUMMARY_TEMPLATE, test_class=test_class, env_class=env_class, seq_class=seq_class)
+    readme.write(summary)
+    log_readme_note("top.sv", lead="\n")
 
-        {test_class}.sv Summary
 
-        Class Structure:
-        - class {test_class} extends uvm_test
-        - Factory registered using `uvm_component_utils({test_class})`
-        - build_phase(): creates `{env_class}`
-        - run_phase():
-            - Creates `{seq_class}`
-            - Raises/drops uvm_objection
-            - Calls `start()` on `{env_class}_h.sqr`
-        ------------------------------------------------------------------------
-		""")
-    with open(readme_path, "a") as rf:
-        rf.write(summary)
-        print("\nRefer to README.txt for a detailed summary of top.sv file:")
-        print(f"   → {readme_path}")
+# Per-interface line formats, bound once; each takes the lowercase name
+ENV_AGENT_DECL_FMT = "\t{0}_agent {0}_agent_h;".format
+ENV_AGENT_CREATE_FMT = '\t\t{0}_agent_h = {0}_agent::type_id::create("{0}_agent_h", this);'.format
+ENV_SBD_CONNECT_TEMPLATE = ("  \t\t//TODO - Check the SBD connection\n"
+                            "\t\t//{name}_agent_h.{name}_h.{name}_ap_h.connect({sbd_inst}.analysis_export);")
+
+ENV_SUMMARY_COMPONENT_FMT = "       - {0.agent} ({0.upper} protocol)".format
+ENV_SUMMARY_TEMPLATE = textwrap.dedent("""\
 
-    print("----------------------------------------------------------------------------")
+    {env_class}.sv Summary
 
-generate_uvm_test(config)
+    Class Structure:
+    - class {env_class} extends uvm_env
+    - Factory registration using `uvm_component_utils`
+    - One agent per interface: {intf_names}
+    - One scoreboard instance: sbd
+    - User need to Implement SBD file manually as of now. Script might be modified in future for SBD generation.
 
+    Instantiated Components:
+    {components}
+    - m_sbd : scoreboard
+
+    TODOs for User:
+    - check the agent to SBD connection
+    ------------------------------------------------------------------------
+    """)
 
-def generate_uvm_env(config):
+def generate_uvm_env(config, readme):
     """
     Generates <dut_name>_env.sv inside verif/ENV/
     and appends a summary to verif/SIM/README.txt.
@@ -452,303 +618,367 @@ def generate_uvm_env(config):
     dut_name = config.get("dut_name", "").strip().lower()
     interfaces = config.get("interfaces", [])
     if not dut_name:
-        print("No DUT name provided. Cannot generate env.")
+        logger.info("No DUT name provided. Cannot generate env.")
         return
 
     env_class = f"{dut_name}_env"
 
-    agent_inst_block = ""
-    create_agent_block = ""
-    
     sbd_class_name = f"{dut_name}_sbd"
     sbd_class_inst_name = f"{sbd_class_name}_h"
     sbd_inst = f"{sbd_class_name} {sbd_class_inst_name}"
-    create_sbd = f'{sbd_class_inst_name} = {sbd_class_name}::type_id::create("{sbd_class_inst_name}", this);'
-
-    env_dir = os.path.join(os.getcwd(), "verif", "ENV")
-    os.makedirs(env_dir, exist_ok=True)
-    env_file_path = os.path.join(env_dir, f"{env_class}.sv")
-
-    with open(env_file_path, "w") as f:
-    		f.write(f"// ----------------------------------------------------\n")
-    		f.write(f"// UVM Environment: {env_class}\n")
-    		f.write(f"// ----------------------------------------------------\n")
-    		f.write(f"class {env_class} extends uvm_env;\n")
-    		f.write(f"	`uvm_component_utils({env_class})\n")
-
-    		# Agents
-    		f.write(f"\n	//Agents instantiation\n")
-    		for intf in interfaces:
-    		    name = intf.get("name", "if").lower()
-    		    agent_class = f"{name}_agent"
-    		    inst = f"{agent_class}_h"
-    		    f.write(f"	{agent_class} {inst};\n")
-
-    		# Scoreboard
-    		f.write(f"\n	//Scoreboard instantiation\n")
-    		f.write(f"	//{sbd_inst};\n\n")
-
-    		# Constructor
-    		f.write(f"	function new(string name = \"{env_class}\", uvm_component parent = null);\n")
-    		f.write(f"		super.new(name, parent);\n")
-    		f.write("	endfunction\n\n")
-
-    		# Build phase
-    		f.write("	virtual function void build_phase(uvm_phase phase);\n")
-    		f.write("		super.build_phase(phase);\n")
-    		for intf in interfaces:
-    		    name = intf.get("name", "if").lower()
-    		    agent_class = f"{name}_agent"
-    		    inst = f"{agent_class}_h"
-    		    f.write(f'		{inst} = {agent_class}::type_id::create("{inst}", this);\n')
-    		f.write(f'		//{sbd_class_inst_name} = {sbd_class_name}::type_id::create("{sbd_class_inst_name}", this);\n')
-    		f.write("	endfunction\n\n")
-
-			# connect_phase phase
-    		f.write("	virtual function void connect_phase(uvm_phase phase);\n")
-    		for intf in interfaces:
-    		    name = intf.get("name", "if").lower()
-    		    agent_class = f"{name}_agent"
-    		    inst = f"{agent_class}_h"
-    		    f.write(f'  		//TODO - Check the SBD connection\n')
-    		    f.write(f'		//{inst}.{name}_h.{name}_ap_h.connect({sbd_class_inst_name}.analysis_export);\n')
-    		f.write("	endfunction\n\n")
-
-    		f.write(f"endclass : {env_class}\n")
-
-
-    print(f"Generated : {env_file_path}")
-
-    sim_dir = os.path.join(os.getcwd(), "verif", "SIM")
-    os.makedirs(sim_dir, exist_ok=True)
-
-    readme_path = os.path.join(sim_dir, "README.txt")
 
+    env_file_path = os.path.join(ENV_DIR, f"{env_class}.sv")
+
+    names = [intf.names.lc for intf in interfaces]
+
+    parts = [
+        "// ----------------------------------------------------",
+        f"// UVM Environment: {env_class}",
+        "// ----------------------------------------------------",
+        f"class {env_class} extends uvm_env;",
+        f"\t`uvm_component_utils({env_class})",
+        "",
+        "\t//Agents instantiation",
+    ]
+    parts.extend(map(ENV_AGENT_DECL_FMT, names))
+
+    # Scoreboard
+    parts += [
+        "",
+        "\t//Scoreboard instantiation",
+        f"\t//{sbd_inst};",
+        "",
+    ]
+
+    # Constructor
+    parts += [
+        f"\tfunction new(string name = \"{env_class}\", uvm_component parent = null);",
+        "\t\tsuper.new(name, parent);",
+        "\tendfunction",
+        "",
+    ]
+
+    # Build phase
+    parts += [
+        "\tvirtual function void build_phase(uvm_phase phase);",
+        "\t\tsuper.build_phase(phase);",
+    ]
+    parts.extend(map(ENV_AGENT_CREATE_FMT, names))
+    parts += [
+        f'\t\t//{sbd_class_inst_name} = {sbd_class_name}::type_id::create("{sbd_class_inst_name}", this);',
+        "\tendfunction",
+        "",
+    ]
+
+    # connect_phase phase
+    parts.append("\tvirtual function void connect_phase(uvm_phase phase);")
+    # SBD instance is DUT-wide: fill it in once, then only {name} per interface
+    sbd_connect = specialize_template(ENV_SBD_CONNECT_TEMPLATE, sbd_inst=sbd_class_inst_name)
+    parts.extend(sbd_connect.format(name=name) for name in names)
+    parts += [
+        "\tendfunction",
+        "",
+        f"endclass : {env_class}",
+        "",
+    ]
+
+    write_files({env_file_path: "\n".join(parts)})
+
+    logger.info(f"Generated : {env_file_path}")
 
     # === Append Summary to README.txt ===
-    summary = textwrap.dedent(f"""\
-        
- {env_class}.sv Summary
-
- Class Structure:
- - class {env_class} extends uvm_env
- - Factory registration using `uvm_component_utils`
- - One agent per interface: {[intf.get('name', 'IF') for intf in interfaces]}
- - One scoreboard instance: sbd
- - User need to Implement SBD file manually as of now. Script might be modified in future for SBD generation.
-
- Instantiated Components:
-{chr(10).join([f"        - {intf.get('name', 'if').lower()}_agent ({intf.get('name', '').upper()} protocol)" for intf in interfaces])}
- - m_sbd : scoreboard
-
- TODOs for User:
- - check the agent to SBD connection
- ------------------------------------------------------------------------
-    """)
+    components = "\n".join(ENV_SUMMARY_COMPONENT_FMT(intf.names) for intf in interfaces)
+    summary = ENV_SUMMARY_TEMPLATE.format(env_class=env_class,
+                                          intf_names=[intf.name for intf in interfaces],
+                                          components=components)
+
+    readme.write(summary)
+    log_readme_note("top.sv", lead="\n")
+
+# === Component templates ===
+# One template per component kind, shared by every interface.
+# Only {name} (the lower-case interface name) varies between renders.
+COMPONENT_TEMPLATES = {
+    "drv": """\
+// ----------------------------------------------------
+//UVM drv: {name}_drv
+//----------------------------------------------------
+class {name}_drv extends uvm_driver#({name}_tx);
+`uvm_component_utils({name}_drv)
+
+virtual {name}_if {name}_vif;
+
+function new(string name = "{name}_drv", uvm_component parent = null);
+  super.new(name, parent);
+endfunction : new
+
+virtual function void build_phase(uvm_phase phase);
+  super.build_phase(phase);
+  if(!uvm_config_db#(virtual {name}_if)::get(this,"","vif",{name}_vif))
+     `uvm_error(get_full_name(),"FAILED TO RETRIVE VIF HANDLE FROM CONFIG_DB")
+endfunction : build_phase
+
+virtual task run_phase(uvm_phase phase);
+`uvm_info(get_full_name(),"run_phase START",UVM_NONE)
+  forever begin
+    seq_item_port.get_next_item(req);
+    //req.print();
+    drive_tx(req);
+    seq_item_port.item_done();
+  end
+endtask : run_phase
+
+task drive_tx({name}_tx tx);
+  // TODO: Implement {name} specific drive logic functionality
+endtask : drive_tx
+
+endclass : {name}_drv
+""",
+    "mon": """\
+// ----------------------------------------------------
+//UVM mon: {name}_mon
+//----------------------------------------------------
+class {name}_mon extends uvm_monitor;
+`uvm_component_utils({name}_mon)
+
+virtual {name}_if {name}_vif;
+
+uvm_analysis_port#({name}_tx) {name}_ap_h;
+
+{name}_tx tx;
+
+function new(string name = "{name}_mon", uvm_component parent = null);
+  super.new(name, parent);
+endfunction : new
+
+virtual function void build_phase(uvm_phase phase);
+  super.build_phase(phase);
+  tx = {name}_tx::type_id::create("tx");
+  {name}_ap_h = new("{name}_ap_h",this);
+  if(!uvm_config_db#(virtual {name}_if)::get(this,"","vif",{name}_vif))
+     `uvm_error(get_full_name(),"FAILED TO RETRIVE VIF HANDLE FROM CONFIG_DB")
+endfunction : build_phase
+
+virtual task run_phase(uvm_phase phase);
+`uvm_info(get_full_name(),"run_phase START",UVM_NONE)
+  forever begin
+    //TODO: Implement {name} specific mon logic functionality
+    {name}_ap_h.write(tx);
+  end
+endtask : run_phase
+
+endclass : {name}_mon
+""",
+    "cov": """\
+// ----------------------------------------------------
+//UVM cov: {name}_cov
+//----------------------------------------------------
+class {name}_cov extends uvm_subscriber#({name}_tx);
+`uvm_component_utils({name}_cov)
+
+{name}_tx tx;
+
+covergroup cg;
+  //TODO - Implement protocol specific FC
+
+endgroup
+
+function new(string name = "{name}_cov", uvm_component parent = null);
+  super.new(name, parent);
+  cg = new();
+endfunction : new
+
+virtual function void write(T t);
+  $cast(tx,t);
+  cg.sample();
+endfunction : write
+
+endclass : {name}_cov
+""",
+    "sqr": """\
+// ----------------------------------------------------
+//UVM sqr: {name}_sqr
+//----------------------------------------------------
+typedef uvm_sequencer#({name}_tx) {name}_sqr;""",
+}
+
+# Agent class for one interface. The driver/sequencer slots are filled in
+# once per mode below, leaving {name} as the only per-interface field.
+AGENT_TEMPLATE = """\
+// ----------------------------------------------------
+//UVM agent: {name}_agent
+//----------------------------------------------------
+class {name}_agent extends uvm_agent;
+`uvm_component_utils({name}_agent)
+
+//Sub-Component Instantiation
+{active_decls}{name}_mon {name}_mon_h;
+{name}_cov {name}_cov_h;
+
+function new(string name = "{name}_agent", uvm_component parent = null);
+  super.new(name, parent);
+endfunction
+
+virtual function void build_phase(uvm_phase phase);
+  super.build_phase(phase);
+  {name}_mon_h = {name}_mon::type_id::create("{name}_mon_h", this);
+  {name}_cov_h = {name}_cov::type_id::create("{name}_cov_h", this);
+{active_build}endfunction
+
+virtual function void connect_phase(uvm_phase phase);
+  super.connect_phase(phase);
+{active_connect}  {name}_mon_h.{name}_ap_h.connect({name}_cov_h.analysis_export);
+endfunction
+
+endclass : {name}_agent
+"""
+
+AGENT_TEMPLATE_ACTIVE = specialize_template(
+    AGENT_TEMPLATE,
+    active_decls=("{name}_drv {name}_drv_h;\n"
+                  "{name}_sqr {name}_sqr_h;\n"),
+    active_build=('  {name}_drv_h = {name}_drv::type_id::create("{name}_drv_h", this);\n'
+                  '  {name}_sqr_h = {name}_sqr::type_id::create("{name}_sqr_h", this);\n'),
+    active_connect="  {name}_drv_h.seq_item_port.connect({name}_sqr_h.seq_item_export);\n")
+AGENT_TEMPLATE_PASSIVE = specialize_template(
+    AGENT_TEMPLATE, active_decls="", active_build="", active_connect="")
+
+AGENT_README_TODO = """
+TODO for User:
+- In Driver file
+-- Implement Protocol specific drive logic functionality
+- In Cov file
+-- Implement protocol specific FC
+- In Mon file
+-- Implement protocol specific mon logic functionality
+---------------------------------------------------------------------------
+"""
+
+# Interface modes that get an agent: M (master, active) / S (slave, passive)
+AGENT_MODES = frozenset({"M", "S"})
+
+# Component suffix -> (base class, renderer taking name=<lc name>).
+# Slaves only observe; masters also get a driver and a sequencer.
+# Per-interface bodies never repeat, so they are formatted directly
+# rather than through the render_template cache, which would only hash
+# the template and hold on to the result.
+PASSIVE_COMPONENTS = {
+    "mon": ("uvm_monitor", COMPONENT_TEMPLATES["mon"].format),
+    "cov": ("uvm_subscriber", COMPONENT_TEMPLATES["cov"].format),
+}
+ACTIVE_COMPONENTS = {
+    **PASSIVE_COMPONENTS,
+    "drv": ("uvm_driver", COMPONENT_TEMPLATES["drv"].format),
+    "sqr": ("uvm_sequencer", COMPONENT_TEMPLATES["sqr"].format),
+}
+
+def render_interface_files(intf, agents_dir):
+    """
+    Renders the agent class and its components for one interface.
+    Pure function (no file I/O), so interfaces are independent of each other.
+    Expects an interface with a name and a mode in AGENT_MODES.
+    Returns a list of (path, content, base_class) tuples, agent first.
+    """
+    name = intf.names.lc
+    is_master = intf.mode.strip().upper() == "M"
+    agent_dir = os.path.join(agents_dir, name)
 
-    with open(readme_path, "a") as rf:
-        rf.write(summary)
-        print("\nRefer to README.txt for a detailed summary of top.sv file:")
-        print(f"   → {readme_path}")
+    # === Agent Class ===
+    agent_template = AGENT_TEMPLATE_ACTIVE if is_master else AGENT_TEMPLATE_PASSIVE
+    rendered = [(os.path.join(agent_dir, f"{intf.names.agent}.sv"),
+                 agent_template.format(name=name), "uvm_agent")]
 
-    print("----------------------------------------------------------------------------")
+    # === Component Classes ===
+    components = ACTIVE_COMPONENTS if is_master else PASSIVE_COMPONENTS
+    for suffix, (base_class, render) in components.items():
+        comp_file = os.path.join(agent_dir, f"{name}_{suffix}.sv")
+        rendered.append((comp_file, render(name=name), base_class))
 
-generate_uvm_env(config)
+    return rendered
 
-def create_full_agent_and_components(cfg):
+def finish_interface_files(rendered, futures, readme_lines):
+    """
+    Waits for one interface's queued writes (re-raising a failed one),
+    then logs its files and adds them to the README summary lines.
     """
-    Generates agent class and its components using f.write()
-    - agent_class.sv
+    for future in futures:
+        future.result()
+    for path, _, base_class in rendered:
+        class_file = os.path.basename(path)
+        if base_class == "uvm_agent":
+            logger.info(f"Created agent class: {path}")
+            readme_lines.append(f" -{class_file}")
+        else:
+            logger.info(f"Created component: {path}")
+            readme_lines.append(f"   └── {class_file} (extends {base_class})")
+
+def create_full_agent_and_components(cfg, readme):
+    """
+    Generates agent class and its components
+    - agent_class.sv (rendered from AGENT_TEMPLATE)
+    - components rendered from COMPONENT_TEMPLATES
     - *_drv.sv, *_sqr.sv (if M), *_mon.sv, *_cov.sv (if M/S)
     - Appends summary to README.txt
     """
 
-    interfaces = cfg.get("interfaces", [])
-    agents_dir = os.path.join(os.getcwd(), "verif", "ENV", "AGENTS")
-    sim_dir = os.path.join(os.getcwd(), "verif", "SIM")
-    os.makedirs(agents_dir, exist_ok=True)
-    os.makedirs(sim_dir, exist_ok=True)
-
-    readme_path = os.path.join(sim_dir, "README.txt")
-    with open(readme_path, "a") as readme:
-        readme.write("\n\nAgent & Component Summary\n")
+    # Interfaces without a name or with an unknown mode get no agent
+    interfaces = [intf for intf in cfg.get("interfaces", [])
+                  if intf.names.lc and intf.mode.strip().upper() in AGENT_MODES]
+    readme_lines = ["\n\nAgent & Component Summary"]
 
+    # Each interface's files are queued on one shared pool as soon as they
+    # are rendered. The previous interface's writes are then waited on, so
+    # at most two interfaces' output is held in memory at a time.
+    pending = None
+    with concurrent.futures.ThreadPoolExecutor(max_workers=WRITE_WORKERS) as pool:
         for intf in interfaces:
-            name = intf.get("name", "").strip().lower()
-            drv_name = f"{name}_drv";
-            drv_inst = f"{drv_name}_h";
-
-            sqr_name = f"{name}_sqr";
-            sqr_inst = f"{sqr_name}_h";
-
-            mon_name = f"{name}_mon";
-            mon_inst = f"{mon_name}_h";
-
-            cov_name = f"{name}_cov";
-            cov_inst = f"{cov_name}_h";
-				
-            mode = intf.get("mode", "").strip().upper()
-            if not name or mode not in ["M", "S"]:
-                continue
-
-            agent_class = f"{name}_agent"
-            agent_dir = os.path.join(agents_dir, name)
-            os.makedirs(agent_dir, exist_ok=True)
-            agent_file = os.path.join(agent_dir, f"{agent_class}.sv")
-
-            # === Write Agent Class ===
-            with open(agent_file, "w") as f:
-                f.write(f"// ----------------------------------------------------\n")
-                f.write(f"//UVM agent: {agent_class}\n")
-                f.write(f"//----------------------------------------------------\n")
-                f.write(f"class {agent_class} extends uvm_agent;\n")
-                f.write(f"`uvm_component_utils({agent_class})\n\n")
-
-                f.write(f"//Sub-Component Instantiation\n")
-                if mode == "M":
-                    f.write(f"{drv_name} {drv_inst};\n")
-                    f.write(f"{sqr_name} {sqr_inst};\n")
-                f.write(f"{mon_name} {mon_inst};\n")
-                f.write(f"{cov_name} {cov_inst};\n\n")
-
-                f.write(f"function new(string name = \"{agent_class}\", uvm_component parent = null);\n")
-                f.write(f"  super.new(name, parent);\n")
-                f.write(f"endfunction\n\n")
-
-                f.write(f"virtual function void build_phase(uvm_phase phase);\n")
-                f.write(f"  super.build_phase(phase);\n")
-                f.write(f"  {mon_inst} = {mon_name}::type_id::create(\"{mon_inst}\", this);\n")
-                f.write(f"  {cov_inst} = {cov_name}::type_id::create(\"{cov_inst}\", this);\n")
-                if mode == "M":
-                    f.write(f"  {drv_inst} = {drv_name}::type_id::create(\"{drv_inst}\", this);\n")
-                    f.write(f"  {sqr_inst} = {sqr_name}::type_id::create(\"{sqr_inst}\", this);\n")
-                f.write(f"endfunction\n\n")
-
-                f.write(f"virtual function void connect_phase(uvm_phase phase);\n")
-                f.write(f"  super.connect_phase(phase);\n")
-                if mode == "M":
-                    f.write(f"  {drv_inst}.seq_item_port.connect({sqr_inst}.seq_item_export);\n")
-                f.write(f"  {mon_inst}.{name}_ap_h.connect({cov_inst}.analysis_export);\n")
-                f.write(f"endfunction\n\n")
-                
-                f.write(f"endclass : {agent_class}\n")
-
-            print(f"Created agent class: {agent_file}")
-            readme.write(f" -{agent_class}.sv\n")
-
-            # === Component Classes ===
-            components = {"mon": "uvm_monitor", "cov": "uvm_subscriber"}
-            if mode == "M":
-                components.update({"drv": "uvm_driver", "sqr": "uvm_sequencer"})
-
-            for suffix, base_class in components.items():
-                class_name = f"{name}_{suffix}"
-                comp_file = os.path.join(agent_dir, f"{class_name}.sv")
-                with open(comp_file, "w") as cf:
-                    cf.write(f"// ----------------------------------------------------\n")
-                    cf.write(f"//UVM {suffix}: {class_name}\n")
-                    cf.write(f"//----------------------------------------------------\n")
-                    if suffix == "sqr":
-                        cf.write(f"typedef {base_class}#({name}_tx) {class_name};")
-                    else:
-                        if suffix == "drv":
-                           cf.write(f"class {class_name} extends {base_class}#({name}_tx);\n")
-                           cf.write(f"`uvm_component_utils({class_name})\n\n")
-                           cf.write(f'virtual {name}_if {name}_vif;\n\n')
-
-                           cf.write(f"function new(string name = \"{class_name}\", uvm_component parent = null);\n")
-                           cf.write(f"  super.new(name, parent);\n")
-                           cf.write(f"endfunction : new\n\n")
-
-                           cf.write(f'virtual function void build_phase(uvm_phase phase);\n')
-                           cf.write(f'  super.build_phase(phase);\n')
-                           cf.write(f'  if(!uvm_config_db#(virtual {name}_if)::get(this,"","vif",{name}_vif))\n')
-                           cf.write(f'     `uvm_error(get_full_name(),"FAILED TO RETRIVE VIF HANDLE FROM CONFIG_DB")\n')
-                           cf.write(f"endfunction : build_phase\n\n")
-                           
-                           cf.write(f'virtual task run_phase(uvm_phase phase);\n')
-                           cf.write(f'`uvm_info(get_full_name(),"run_phase START",UVM_NONE)\n')
-                           cf.write(f'  forever begin\n')
-                           cf.write(f'    seq_item_port.get_next_item(req);\n')
-                           cf.write(f'    //req.print();\n')
-                           cf.write(f'    drive_tx(req);\n')
-                           cf.write(f'    seq_item_port.item_done();\n')
-                           cf.write(f'  end\n')
-                           cf.write(f'endtask : run_phase\n\n')
-
-                           cf.write(f'task drive_tx({name}_tx tx);\n')
-                           cf.write(f"  // TODO: Implement {name} specific drive logic functionality\n")
-                           cf.write(f'endtask : drive_tx\n\n')
-
-                        if suffix == "mon":
-                           cf.write(f"class {class_name} extends {base_class};\n")
-                           cf.write(f"`uvm_component_utils({class_name})\n\n")
-                           cf.write(f'virtual {name}_if {name}_vif;\n\n')
-                           cf.write(f'uvm_analysis_port#({name}_tx) {name}_ap_h;\n\n')
-                           cf.write(f'{name}_tx tx;\n\n')
-                           
-                           cf.write(f"function new(string name = \"{class_name}\", uvm_component parent = null);\n")
-                           cf.write(f"  super.new(name, parent);\n")
-                           cf.write(f"endfunction : new\n\n")
-                           
-                           cf.write(f'virtual function void build_phase(uvm_phase phase);\n')
-                           cf.write(f'  super.build_phase(phase);\n')
-                           cf.write(f'  tx = {name}_tx::type_id::create("tx");\n')
-                           cf.write(f'  {name}_ap_h = new("{name}_ap_h",this);\n')
-                           cf.write(f'  if(!uvm_config_db#(virtual {name}_if)::get(this,"","vif",{name}_vif))\n')
-                           cf.write(f'     `uvm_error(get_full_name(),"FAILED TO RETRIVE VIF HANDLE FROM CONFIG_DB")\n')
-                           cf.write(f"endfunction : build_phase\n\n")
-									
-                           cf.write(f'virtual task run_phase(uvm_phase phase);\n')
-                           cf.write(f'`uvm_info(get_full_name(),"run_phase START",UVM_NONE)\n')
-                           cf.write(f'  forever begin\n')
-                           cf.write(f'    //TODO: Implement {name} specific mon logic functionality\n')
-                           cf.write(f'    {name}_ap_h.write(tx);\n')
-                           cf.write(f'  end\n')
-                           cf.write(f'endtask : run_phase\n\n')
-								
-                        if suffix == "cov":
-                           cf.write(f"class {class_name} extends {base_class}#({name}_tx);\n")
-                           cf.write(f"`uvm_component_utils({class_name})\n\n")
-                           cf.write(f'{name}_tx tx;\n\n')
-                           
-                           cf.write(f"covergroup cg;\n")
-                           cf.write(f"  //TODO - Implement protocol specific FC\n\n")
-                           cf.write(f"endgroup\n\n")
-                        
-                           cf.write(f"function new(string name = \"{class_name}\", uvm_component parent = null);\n")
-                           cf.write(f"  super.new(name, parent);\n")
-                           cf.write(f"  cg = new();\n")
-                           cf.write(f"endfunction : new\n\n")
-                        
-                           cf.write(f'virtual function void write(T t);\n')
-                           cf.write(f'  $cast(tx,t);\n')
-                           cf.write(f'  cg.sample();\n')
-                           cf.write(f'endfunction : write\n\n')
-                           
-                        cf.write(f"endclass : {class_name}\n")
-
-                print(f"Created component: {comp_file}")
-                readme.write(f"   └── {class_name}.sv (extends {base_class})\n")
-
-    with open(readme_path, "a") as rf:
-          rf.write(f'TODO for User:\n')
-          rf.write(f'- In Driver file\n')
-          rf.write(f'-- Implement Protocol specific drive logic functionality\n')
-          rf.write(f'- In Cov file\n')
-          rf.write(f'-- Implement protocol specific FC\n')
-          rf.write(f'- In Mon file\n')
-          rf.write(f'-- Implement protocol specific mon logic functionality\n')
-          rf.write(f'---------------------------------------------------------------------------\n')
-          
-          print("\nRefer to README.txt for a detailed summary of agents and its components file:")
-          print(f"   → {readme_path}")
-
-    print("----------------------------------------------------------------------------")
-
-create_full_agent_and_components(config)
-
-def generate_base_seq(cfg):
+            rendered = render_interface_files(intf, AGENTS_DIR)
+            futures = submit_files(pool, {path: content for path, content, _ in rendered})
+            if pending:
+                finish_interface_files(*pending, readme_lines)
+            pending = rendered, futures
+        if pending:
+            finish_interface_files(*pending, readme_lines)
+
+    # Whole summary goes out in one write
+    readme.write("\n".join(readme_lines))
+    readme.write(AGENT_README_TODO)
+
+    log_readme_note("agents and its components", lead="\n")
+
+SEQ_TEMPLATE = """\
+// ----------------------------------------------------
+//UVM sequence: {seq_class}
+//----------------------------------------------------
+class {seq_class} extends uvm_sequence;
+`uvm_object_utils({seq_class})
+
+function new(string name = "{seq_class}");
+  super.new(name);
+endfunction
+
+virtual task body();
+  `uvm_info(get_type_name(), "Starting {seq_class}", UVM_NONE)
+  //Randomizing req
+  `uvm_do(req)
+endtask
+
+endclass : {seq_class}
+"""
+
+SEQ_SUMMARY_TEMPLATE = """
+{seq_class}.sv Summary
+- Class {seq_class} extends uvm_sequence
+- Factory registration with `uvm_object_utils`
+- new() constructor
+- body() includes:
+   - `uvm_info` to indicate start of sequence
+   - `uvm_do macro which allows tool to randomize the tx fields
+- TODO: Define sequence item type (req) and if needed use uuvm_do_with instead of uvm_do
+---------------------------------------------------------------------------------------------
+"""
+
+def generate_base_seq(cfg, readme):
     """
     Generates <dut_name>_base_seq.sv inside verif/SEQ_LIB/
     - Class extends uvm_sequence
@@ -759,59 +989,49 @@ def generate_base_seq(cfg):
 
     dut_name = cfg.get("dut_name", "").strip().lower()
     if not dut_name:
-        print("No DUT name found in config. Skipping base sequence generation.")
+        logger.info("No DUT name found in config. Skipping base sequence generation.")
         return
 
     seq_class = f"{dut_name}_base_seq"
-    seq_dir = os.path.join(os.getcwd(), "verif", "SEQ_LIB")
-    sim_dir = os.path.join(os.getcwd(), "verif", "SIM")
-    os.makedirs(seq_dir, exist_ok=True)
-    os.makedirs(sim_dir, exist_ok=True)
+    seq_file = os.path.join(SEQ_DIR, f"{seq_class}.sv")
 
-    seq_file = os.path.join(seq_dir, f"{seq_class}.sv")
-    readme_path = os.path.join(sim_dir, "README.txt")
+    write_files({seq_file: render_template(SEQ_TEMPLATE, seq_class=seq_class)})
 
-    with open(seq_file, "w") as f:
-        f.write(f"// ----------------------------------------------------\n")
-        f.write(f"//UVM sequence: {seq_class}\n")
-        f.write(f"//----------------------------------------------------\n")
-        f.write(f"class {seq_class} extends uvm_sequence;\n")
-        f.write(f"`uvm_object_utils({seq_class})\n\n")
+    logger.info(f"Generated base sequence: {seq_file}")
 
-        f.write(f"function new(string name = \"{seq_class}\");\n")
-        f.write( "  super.new(name);\n")
-        f.write( "endfunction\n\n")
+    # === Append summary to README.txt ===
+    readme.write(render_template(SEQ_SUMMARY_TEMPLATE, seq_class=seq_class))
 
-        f.write( "virtual task body();\n")
-        f.write(f"  `uvm_info(get_type_name(), \"Starting {seq_class}\", UVM_NONE)\n")
-        f.write(f"  //Randomizing req\n")
-        f.write(f"  `uvm_do(req)\n")
-        f.write( "endtask\n\n")
+    log_readme_note("agents and its components", lead="\n")
 
-        f.write(f"endclass : {seq_class}\n")
+# === Main flow ===
+def main():
+    from datetime import datetime  # only needed for the log header
 
-    print(f"Generated base sequence: {seq_file}")
+    setup_logging()
 
-    # === Append summary to README.txt ===
-    with open(readme_path, "a") as rf:
-        rf.write(f"""\n{seq_class}.sv Summary
-- Class {seq_class} extends uvm_sequence
-- Factory registration with `uvm_object_utils`
-- new() constructor
-- body() includes:
-   - `uvm_info` to indicate start of sequence
-   - `uvm_do macro which allows tool to randomize the tx fields
-- TODO: Define sequence item type (req) and if needed use uuvm_do_with instead of uvm_do
----------------------------------------------------------------------------------------------
-""")
+    # === Log Header ===
+    logger.info(f">> Log started at: {datetime.now()} <<")
+    logger.info(f">> Python version: {sys.version.split()[0]} ({sys.executable}) <<\n")
 
-    print("\nRefer to README.txt for a detailed summary of agents and its components file:")
-    print(f"   → {readme_path}")
+    config = read_interface_csv(CSV_FILE)
+    log_config(config)
 
+    create_uvm_tb_dirs()
+    logger.info(LOG_SEPARATOR)
 
-    print("----------------------------------------------------------------------------")
+    # Every generator appends its README.txt summary to this in-memory buffer;
+    # the file itself is written once, at the end of the run.
+    readme_buf = io.StringIO()
 
-generate_base_seq(config)
+    generate_top_sv_from_cfg(config, readme_buf)
+    generate_uvm_test(config, readme_buf)
+    generate_uvm_env(config, readme_buf)
+    create_full_agent_and_components(config, readme_buf)
+    generate_base_seq(config, readme_buf)
 
-log_file.close()  # only needed if using direct open/write
+    # Every summary has been collected; README.txt goes out in one write
+    write_files({README_PATH: readme_buf.getvalue()})
 
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,31 @@
+import concurrent.futures
+import contextlib
 import datetime
+import functools
+import logging
+import mmap
+import os
+import shutil
+import tempfile
 
-def insert_script_header(script_path, version="1.0.0"):
-    today = datetime.date.today().strftime("%B %d, %Y")  # Format: July 01, 2025
+log = logging.getLogger(__name__)
 
-    header = f"""\
+# Marker line of the header, used to detect files that already have one
+HEADER_SENTINEL = b"Author      : Koushik Shridhar"
+
+# The sentinel sits near the top, so only this much of a file is probed
+PROBE_SIZE = 2048
+
+# Scripts already handled (headed or found headed) in this process, by
+# real path, so repeat calls skip even the probe read
+handled_paths = set()
+
+# The files are independent and the work is I/O, so they are handled
+# side by side on a few threads
+MAX_WORKERS = 4
+
+# Header text; {today} and {version} are filled in by render_header
+HEADER_TEMPLATE = """\
 # =============================================================================
 # Author      : Koushik Shridhar
 # Date        : {today}
@@ -49,23 +71,161 @@ def insert_script_header(script_path, version="1.0.0"):
 # =============================================================================
 """
 
-    # Read original script
-    with open(script_path, "r") as f:
-        original = f.read()
+# The fixed text around the two fields, split and encoded once at import
+_before_today, _, _rest = HEADER_TEMPLATE.partition("{today}")
+_before_version, _, _after_version = _rest.partition("{version}")
+HEADER_PARTS = tuple(part.encode("utf-8")
+                     for part in (_before_today, _before_version, _after_version))
 
-    # Check if already added (by checking the first few lines)
-    if "Author      : Koushik Shridhar" in original.splitlines()[0:10]:
-        print("⚠️  Header already exists. Skipping insertion.")
-        return
+def today_stamp():
+    """Today's date as stamped into headers, e.g. "July 01, 2025"."""
+    return datetime.date.today().strftime("%B %d, %Y")
 
-    # Write updated content
-    with open(script_path, "w") as f:
-        f.write(header + "\n" + original)
+# The header only varies with the date and the version, so it is built
+# once per pair and reused by every file it is inserted into. Building it
+# is a plain bytes join of the pre-encoded parts, no template parsing.
+@functools.lru_cache(maxsize=4)
+def render_header(today, version):
+    head, middle, tail = HEADER_PARTS
+    return b"".join((head, today.encode("utf-8"), middle, version.encode("utf-8"), tail))
 
-    print(f"✅ Header inserted at top of {script_path}")
+def map_file(f):
+    """
+    Read-only mmap of an open file, as a context manager. Empty files
+    cannot be mapped and yield b"" instead.
+    """
+    if os.fstat(f.fileno()).st_size == 0:
+        return contextlib.nullcontext(b"")
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
 
+def write_all(fd, chunks):
+    """
+    Writes every chunk to fd, in order, with gathered writes where the
+    OS has them (POSIX) and one chunk per write elsewhere. A write may
+    stop short (signal, full disk, the per-call size cap), so this keeps
+    going from where the previous call stopped.
+    """
+    views = [memoryview(chunk) for chunk in chunks if len(chunk)]
+    try:
+        while views:
+            if hasattr(os, "writev"):
+                written = os.writev(fd, views)
+            else:
+                written = os.write(fd, views[0])
+            while views and written >= len(views[0]):
+                written -= len(views.pop(0))
+            if written:
+                views[0] = views[0][written:]
+    finally:
+        # Views onto an mmap must be gone before the mapping can close
+        for view in views:
+            view.release()
 
-# === Example Usage ===
-insert_script_header("test1.py")
-insert_script_header("UVM_Tb_generator.py")
+def insert_script_header(script_path, version="1.0.0", today=None):
+    """
+    Prepends the header to script_path unless it already has one.
+    today is the date string to stamp, the current date by default.
+    Returns True if the file was rewritten.
+    """
+    real_path = os.path.realpath(script_path)
+    if real_path in handled_paths:
+        return False
+
+    tmp_path = None
+    try:
+        # The script is mapped rather than read: the probe below and the write
+        # of the new file both work straight off the page cache, and the body
+        # is never copied into a Python bytes object.
+        with open(script_path, "rb", buffering=0) as src, map_file(src) as body:
+            # Check if already added: a substring search over the first
+            # PROBE_SIZE bytes only
+            if body.find(HEADER_SENTINEL, 0, PROBE_SIZE) != -1:
+                # Debug only: re-runs over already-headed files stay quiet
+                log.debug("⚠️  Header already exists in %s. Skipping insertion.", script_path)
+                handled_paths.add(real_path)
+                return False
+
+            # The date is only looked up once the file is known to need a header
+            if today is None:
+                today = today_stamp()
+
+            # Raw descriptor with no Python-level buffer in between. The temp
+            # file gets a fresh name next to the real file (so the rename stays
+            # on one filesystem and no user file is clobbered) and stays private
+            # until it takes over the script's mode below.
+            fd, tmp_path = tempfile.mkstemp(prefix=".", suffix=".tmp",
+                                            dir=os.path.dirname(real_path))
+            try:
+                # Header and the whole body go out in one gathered write
+                write_all(fd, [render_header(today, version), b"\n", body])
+                # The new contents must be on disk before the rename points at them
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+        # Swapped in only once the script is closed and unmapped: Windows
+        # refuses to replace a file that is still open or mapped.
+        shutil.copymode(real_path, tmp_path)
+        # The script is either fully old or fully new, never truncated.
+        # The real file is replaced, so a symlink to it stays a symlink.
+        os.replace(tmp_path, real_path)
+    except BaseException:
+        if tmp_path is not None:
+            os.remove(tmp_path)
+        raise
+
+    handled_paths.add(real_path)
+    log.info("✅ Header inserted at top of %s", script_path)
+    return True
 
+def sync_dirs(dirs):
+    """fsyncs each directory once, making the renames done in it durable."""
+    for d in dirs:
+        fd = os.open(d, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+def insert_script_headers(script_paths, version="1.0.0"):
+    """
+    Inserts the same header into every script in script_paths, several
+    files at a time. Directories are synced once at the end rather than
+    after every file. If some files fail, the others are still finished
+    and synced, then the first failure is raised.
+    """
+    # A file listed twice (possibly under another name) must not be
+    # rewritten by two threads at once
+    paths = list({os.path.realpath(p): p for p in script_paths}.values())
+
+    # One date for the whole batch, taken when the batch starts
+    today = today_stamp()
+
+    workers = max(1, min(MAX_WORKERS, len(paths)))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(insert_script_header, p, version, today) for p in paths]
+
+    touched_dirs = set()
+    errors = []
+    for path, future in zip(paths, futures):
+        error = future.exception()
+        if error is not None:
+            log.error("❌ Header insertion failed for %s: %s", path, error)
+            errors.append(error)
+        elif future.result():
+            touched_dirs.add(os.path.dirname(os.path.realpath(path)))
+
+    # Directories can only be opened for fsync on POSIX systems
+    if os.name == "posix":
+        sync_dirs(touched_dirs)
+
+    if errors:
+        raise errors[0]
+
+
+# === Example Usage ===
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    insert_script_headers(["test1.py", "UVM_Tb_generator.py"])
+    # Flush and close the log handlers right after the batch
+    logging.shutdown()